@@ -12,6 +12,8 @@ from ivy.func_wrapper import _wrap_function
 
 backend_stack = []
 implicit_backend = "numpy"
+# incremented whenever the backend returned by current_backend(None) may change
+_backend_version = 0
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
 
@@ -130,7 +132,7 @@ def current_backend(*args, **kwargs):
     <module 'ivy.functional.backends.jax' from '/ivy/ivy/functional/backends/jax/__init__.py'>   # noqa
 
     """
-    global implicit_backend
+    global implicit_backend, _backend_version
     # if a global backend has been set with set_backend then this will be returned
     if backend_stack:
         f = backend_stack[-1]
@@ -141,7 +143,10 @@ def current_backend(*args, **kwargs):
     # if no global backend exists, we try to infer the backend from the arguments
     f = _determine_backend_from_args(list(args) + list(kwargs.values()))
     if f is not None:
-        implicit_backend = f.current_backend_str()
+        f_str = f.current_backend_str()
+        if f_str != implicit_backend:
+            implicit_backend = f_str
+            _backend_version += 1
         return f
     if verbosity.level > 0:
         verbosity.cprint("Using backend from type: {}".format(f))
@@ -170,7 +175,7 @@ def set_backend(backend: str):
 
     """
     ivy.locks["backend_setter"].acquire()
-    global ivy_original_dict
+    global ivy_original_dict, _backend_version
     if not backend_stack:
         ivy_original_dict = ivy.__dict__.copy()
     if isinstance(backend, str):
@@ -183,6 +188,7 @@ def set_backend(backend: str):
     if backend.current_backend_str() == "numpy":
         ivy.set_default_device("cpu")
     backend_stack.append(backend)
+    _backend_version += 1
 
     for k, v in ivy_original_dict.items():
         if k not in backend.__dict__:
@@ -279,10 +285,12 @@ def unset_backend():
     <class'tensorflow.python.framework.ops.EagerTensor'>
 
     """
+    global _backend_version
     backend = None
     # if the backend stack is empty, nothing is done and we just return `None`
     if backend_stack:
         backend = backend_stack.pop(-1)  # remove last backend from the stack
+        _backend_version += 1
         if backend.current_backend_str() == "numpy":
             ivy.unset_default_device()
         # the new backend is the backend that was set before the one we just removed
@@ -142,6 +142,14 @@ def _get_first_array(*args, **kwargs):
     return arr
 
 
+def _may_contain_ivy_arrays(args, kwargs):
+    # only ivy.Array instances and nests which could hold them need to be converted
+    types = (ivy.Array, list, tuple, dict)
+    return any(isinstance(a, types) for a in args) or any(
+        isinstance(v, types) for v in kwargs.values()
+    )
+
+
 # Array Handling #
 # ---------------#
 
@@ -166,6 +174,9 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
         -------
             The return of the function, with native arrays passed in the arguments.
         """
+        # skip the conversion for calls without arrays, such as dtype-only calls
+        if not _may_contain_ivy_arrays(args, kwargs):
+            return fn(*args, **kwargs)
         # convert all arrays in the inputs to ivy.NativeArray instances
         native_args, native_kwargs = ivy.args_to_native(
             *args, **kwargs, include_derived={tuple: True}
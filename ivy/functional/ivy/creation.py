@@ -749,3 +749,41 @@ def logspace(
 
     """
     return _cur_backend(start).logspace(start, stop, num, base, axis, device=device)
+
+
+@outputs_to_ivy_arrays
+@infer_dtype
+@infer_device
+def zero_allocated(
+    shape: Union[int, Tuple[int], List[int]],
+    *,
+    dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+) -> ivy.Array:
+    """Returns an array of zeros with the specified ``shape``, created by broadcasting a
+    single zero. With the numpy and torch backends no memory is allocated for the
+    individual elements, which is useful for large constant arrays of zeros. The jax
+    and tensorflow backends materialize the full array.
+
+    .. note::
+       The returned array may be a broadcast view, and must be treated as read-only.
+
+    Parameters
+    ----------
+    shape
+       output array shape.
+    dtype
+       output array data type. If ``dtype`` is ``None``, the output array data type must
+       be the default floating-point data type. Default  ``None``.
+    device
+       device on which to place the created array. Default: ``None``.
+
+    Returns
+    -------
+    ret
+        a read-only array containing zeros.
+
+    """
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    backend = _cur_backend()
+    return backend.broadcast_to(backend.zeros((), dtype=dtype, device=device), shape)
@@ -1,12 +1,16 @@
 # global
 import math
+import struct
+import collections
 import importlib
+import functools
 import numpy as np
 from numbers import Number
 from typing import Union, Tuple, List, Optional, Callable
 
 # local
 import ivy
+from ivy import backend_handler
 from ivy.backend_handler import current_backend as _cur_backend
 from ivy.func_wrapper import (
     handle_out_argument,
@@ -20,6 +24,62 @@ from ivy.func_wrapper import (
 Finfo = None
 Iinfo = None
 
+_DtypeInfo = collections.namedtuple("_DtypeInfo", ["bits", "is_int", "is_float"])
+
+# the attributes of the valid dtype strings are identical for every backend, so they
+# are tabulated once rather than derived through a backend call on each query
+_DTYPE_TABLE = {
+    "bool": _DtypeInfo(1, False, False),
+    "int8": _DtypeInfo(8, True, False),
+    "int16": _DtypeInfo(16, True, False),
+    "int32": _DtypeInfo(32, True, False),
+    "int64": _DtypeInfo(64, True, False),
+    "uint8": _DtypeInfo(8, True, False),
+    "uint16": _DtypeInfo(16, True, False),
+    "uint32": _DtypeInfo(32, True, False),
+    "uint64": _DtypeInfo(64, True, False),
+    "bfloat16": _DtypeInfo(16, False, True),
+    "float16": _DtypeInfo(16, False, True),
+    "float32": _DtypeInfo(32, False, True),
+    "float64": _DtypeInfo(64, False, True),
+}
+_INT_DTYPES = frozenset(k for k, v in _DTYPE_TABLE.items() if v.is_int)
+_FLOAT_DTYPES = frozenset(k for k, v in _DTYPE_TABLE.items() if v.is_float)
+_INT_TYPES = (int, np.integer)
+_FLOAT_TYPES = (float, np.floating)
+
+# every backend maps dtype strings to ivy.Dtype unchanged, so known dtype strings
+# can be served without a backend lookup
+_IVY_DTYPES = {d: ivy.Dtype(d) for d in _DTYPE_TABLE}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_backend(version):
+    # the version counter is bumped whenever the backend returned by
+    # _cur_backend(None) may change, which invalidates the cached lookup
+    return _cur_backend(None)
+
+
+# noinspection PyShadowingBuiltins
+@functools.lru_cache(maxsize=64)
+def _iinfo_cached(type, version):
+    return _cached_backend(version).iinfo(type)
+
+
+# noinspection PyShadowingBuiltins
+@functools.lru_cache(maxsize=64)
+def _finfo_cached(type, version):
+    return _cached_backend(version).finfo(type)
+
+
+@functools.lru_cache(maxsize=256)
+def _promote_types_cached(dtype_a, dtype_b, version):
+    backend = _cached_backend(version)
+    ret = backend.result_type(
+        backend.as_native_dtype(dtype_a), backend.as_native_dtype(dtype_b)
+    )
+    return backend.as_ivy_dtype(ret)
+
 
 # Dtype Info #
 
@@ -70,7 +130,14 @@ def iinfo(type: Union[ivy.Dtype, str, ivy.Array, ivy.NativeArray]) -> Iinfo:
           smallest representable number.
 
     """
-    return _cur_backend(None).iinfo(type)
+    version = backend_handler._backend_version
+    if ivy.is_native_array(type):
+        type = ivy.dtype(type)
+    try:
+        return _iinfo_cached(type, version)
+    except TypeError:
+        # unhashable dtype objects cannot be cached
+        return _cached_backend(version).iinfo(type)
 
 
 @inputs_to_native_arrays
@@ -99,7 +166,14 @@ def finfo(type: Union[ivy.Dtype, str, ivy.Array, ivy.NativeArray]) -> Finfo:
           smallest positive floating-point number with full precision.
 
     """
-    return _cur_backend(None).finfo(type)
+    version = backend_handler._backend_version
+    if ivy.is_native_array(type):
+        type = ivy.dtype(type)
+    try:
+        return _finfo_cached(type, version)
+    except TypeError:
+        # unhashable dtype objects cannot be cached
+        return _cached_backend(version).finfo(type)
 
 
 @to_native_arrays_and_back
@@ -217,20 +291,25 @@ def astype(
     >>> print(y)
     ivy.array([1., 2.])
     """
+    if not copy and ivy.dtype(x, as_native=True) == as_native_dtype(dtype):
+        # no cast or copy is required, so the input array is returned directly
+        return x
     return _cur_backend(x).astype(x, dtype, copy=copy)
 
 
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
+default_dtype_stack = collections.deque()
+default_float_dtype_stack = collections.deque()
+default_int_dtype_stack = collections.deque()
 
 
 class DefaultDtype:
     """"""
 
+    __slots__ = ("_dtype",)
+
     # noinspection PyShadowingNames
     def __init__(self, dtype):
         self._dtype = dtype
@@ -247,6 +326,8 @@ class DefaultDtype:
 class DefaultFloatDtype:
     """"""
 
+    __slots__ = ("_float_dtype",)
+
     # noinspection PyShadowingNames
     def __init__(self, float_dtype):
         self._float_dtype = float_dtype
@@ -263,12 +344,14 @@ class DefaultFloatDtype:
 class DefaultIntDtype:
     """"""
 
+    __slots__ = ("_int_dtype",)
+
     # noinspection PyShadowingNames
-    def __init__(self, float_dtype):
-        self._float_dtype = float_dtype
+    def __init__(self, int_dtype):
+        self._int_dtype = int_dtype
 
     def __enter__(self):
-        set_default_int_dtype(self._float_dtype)
+        set_default_int_dtype(self._int_dtype)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -290,6 +373,10 @@ def dtype_bits(dtype_in: Union[ivy.Dtype, str]) -> int:
         The number of bits used to represent the data type.
 
     """
+    if isinstance(dtype_in, str):
+        info = _DTYPE_TABLE.get(dtype_in)
+        if info is not None:
+            return info.bits
     return _cur_backend(dtype_in).dtype_bits(dtype_in)
 
 
@@ -307,7 +394,11 @@ def as_ivy_dtype(dtype_in: Union[ivy.Dtype, str]) -> ivy.Dtype:
         data type string 'float32'
 
     """
-    return _cur_backend(None).as_ivy_dtype(dtype_in)
+    if isinstance(dtype_in, str):
+        ret = _IVY_DTYPES.get(dtype_in)
+        if ret is not None:
+            return ret
+    return _cached_backend(backend_handler._backend_version).as_ivy_dtype(dtype_in)
 
 
 def as_native_dtype(dtype_in: Union[ivy.Dtype, ivy.NativeDtype]) -> ivy.NativeDtype:
@@ -324,7 +415,30 @@ def as_native_dtype(dtype_in: Union[ivy.Dtype, ivy.NativeDtype]) -> ivy.NativeDt
         data type e.g. ivy.float32.
 
     """
-    return _cur_backend(None).as_native_dtype(dtype_in)
+    if not isinstance(dtype_in, str):
+        # already native, every backend returns these unchanged
+        return dtype_in
+    return _cached_backend(backend_handler._backend_version).as_native_dtype(dtype_in)
+
+
+def _flatten_nest(nest):
+    if isinstance(nest, (list, tuple)):
+        return [leaf for item in nest for leaf in _flatten_nest(item)]
+    if isinstance(nest, dict):
+        return [leaf for v in nest.values() for leaf in _flatten_nest(v)]
+    return [nest]
+
+
+def _scan_int_range(flat):
+    # single pass over the leaves, the uint64 check takes priority over int64
+    inf = ivy.inf
+    ret = None
+    for x in flat:
+        if x > 9223372036854775807 and x != inf:
+            return ivy.uint64
+        if ret is None and x > 2147483647 and x != inf:
+            ret = ivy.int64
+    return ret
 
 
 # noinspection PyShadowingNames,PyShadowingBuiltins
@@ -332,6 +446,7 @@ def default_int_dtype(
     input=None,
     int_dtype: Optional[Union[ivy.IntDtype, ivy.NativeDtype]] = None,
     as_native: Optional[bool] = None,
+    _flat: Optional[List] = None,
 ) -> Union[ivy.IntDtype, ivy.NativeDtype]:
     """Summary.
 
@@ -343,6 +458,9 @@ def default_int_dtype(
 
     as_native
          (Default value = None)
+    _flat
+        The flattened leaves of a nested input, if already computed by the caller.
+        Used internally, do not set manually.
 
     Returns
     -------
@@ -356,22 +474,15 @@ def default_int_dtype(
         elif as_native is False:
             return ivy.IntDtype(ivy.as_ivy_dtype(int_dtype))
         return int_dtype
-    as_native = ivy.default(as_native, False)
+    as_native = False if as_native is None else as_native
     if ivy.exists(input):
         if ivy.is_native_array(input):
             ret = ivy.dtype(input)
         elif isinstance(input, np.ndarray):
             ret = input.dtype
         elif isinstance(input, (list, tuple, dict)):
-            if ivy.nested_indices_where(
-                input, lambda x: x > 9223372036854775807 and x != ivy.inf
-            ):
-                ret = ivy.uint64
-            elif ivy.nested_indices_where(
-                input, lambda x: x > 2147483647 and x != ivy.inf
-            ):
-                ret = ivy.int64
-            else:
+            ret = _scan_int_range(_flatten_nest(input) if _flat is None else _flat)
+            if ret is None:
                 def_dtype = default_dtype()
                 if ivy.is_int_dtype(def_dtype):
                     ret = def_dtype
@@ -393,7 +504,6 @@ def default_int_dtype(
                 else:
                     ret = ivy.int32
     else:
-        global default_int_dtype_stack
         if not default_int_dtype_stack:
             def_dtype = default_dtype()
             if ivy.is_int_dtype(def_dtype):
@@ -407,20 +517,39 @@ def default_int_dtype(
     return ivy.IntDtype(ivy.as_ivy_dtype(ret))
 
 
-# len(get_binary_from_float(x)) >24 and int(get_binary_from_float(x)[24:])>0)
+# mantissa bits of a float64 which are dropped when truncating to float32
+_F32_MANT_MASK = (1 << 29) - 1
+_PACK_D = struct.Struct("<d").pack
+_UNPACK_D = struct.Struct("<Q").unpack
+
+
 # noinspection PyShadowingBuiltins
 def _check_float64(input):
-    if math.isfinite(input):
-        tmp = str(input).replace("-", "").split(".")
-        exponent = int(math.floor(math.log10(abs(input)))) if input != 0 else 0
-        mant = bin(int(tmp[0])).replace("0b", "")
-        return (
-            (input > 3.4028235 * 10**38)
-            or (len(mant) > 24 and int(mant[24:]) > 0)
-            or (exponent < -126)
-            or (exponent > 127)
-        )
-    return False
+    if not math.isfinite(input):
+        return False
+    # base-2 exponent, frexp(0.0) gives an exponent of 0 so zero needs no special case
+    exp = math.frexp(input)[1] - 1
+    bits = _UNPACK_D(_PACK_D(input))[0]
+    # only the mantissa bits belonging to the integer part are checked, fractional
+    # bits which do not fit into float32 are not considered to require float64
+    return (
+        abs(input) > 3.4028235e38
+        or (bits & _F32_MANT_MASK) >> max(0, 52 - exp) != 0
+        or exp < -126
+        or exp > 127
+    )
+
+
+def _needs_float64_vec(arr):
+    a = np.asarray(arr, dtype=np.float64).reshape(-1)
+    a = a[np.isfinite(a) & (a != 0)]
+    bits = a.view(np.uint64)
+    exp = ((bits >> 52) & 0x7FF).astype(np.int64) - 1023
+    # same checks as _check_float64, applied to all values at once
+    shift = np.clip(52 - exp, 0, 63).astype(np.uint64)
+    int_tail = ((bits & _F32_MANT_MASK) >> shift) != 0
+    bad = (np.abs(a) > 3.4028235e38) | int_tail | (exp < -126) | (exp > 127)
+    return bool(bad.any())
 
 
 # noinspection PyShadowingNames,PyShadowingBuiltins
@@ -428,6 +557,7 @@ def default_float_dtype(
     input=None,
     float_dtype: Optional[Union[ivy.FloatDtype, ivy.NativeDtype]] = None,
     as_native: Optional[bool] = None,
+    _flat: Optional[List] = None,
 ) -> Union[ivy.Dtype, str]:
     """Summary.
 
@@ -439,6 +569,9 @@ def default_float_dtype(
 
     as_native
          (Default value = None)
+    _flat
+        The flattened leaves of a nested input, if already computed by the caller.
+        Used internally, do not set manually.
 
     Returns
     -------
@@ -452,14 +585,21 @@ def default_float_dtype(
         elif as_native is False:
             return ivy.FloatDtype(ivy.as_ivy_dtype(float_dtype))
         return float_dtype
-    as_native = ivy.default(as_native, False)
+    as_native = False if as_native is None else as_native
     if ivy.exists(input):
         if ivy.is_native_array(input):
             ret = ivy.dtype(input)
         elif isinstance(input, np.ndarray):
             ret = input.dtype
         elif isinstance(input, (list, tuple, dict)):
-            if ivy.nested_indices_where(input, lambda x: _check_float64(x)):
+            try:
+                needs_float64 = _needs_float64_vec(
+                    _flatten_nest(input) if _flat is None else _flat
+                )
+            except (TypeError, ValueError, OverflowError):
+                # ragged or non-numeric leaves
+                needs_float64 = ivy.nested_any(input, _check_float64)
+            if needs_float64:
                 ret = ivy.float64
             else:
                 def_dtype = default_dtype()
@@ -477,7 +617,6 @@ def default_float_dtype(
                 else:
                     ret = ivy.float32
     else:
-        global default_float_dtype_stack
         if not default_float_dtype_stack:
             def_dtype = default_dtype()
             if ivy.is_float_dtype(def_dtype):
@@ -491,6 +630,33 @@ def default_float_dtype(
     return ivy.FloatDtype(ivy.as_ivy_dtype(ret))
 
 
+def _scalar_default_dtype(item, as_native):
+    # flattened equivalent of the Number branches of default_float_dtype and
+    # default_int_dtype, for python bool, int and float scalars
+    item_type = item.__class__
+    if item_type is bool:
+        return as_native_dtype("bool") if as_native else "bool"
+    if default_dtype_stack:
+        def_dtype = default_dtype_stack[-1]
+    elif default_float_dtype_stack:
+        def_dtype = default_float_dtype_stack[-1]
+    else:
+        def_dtype = "float32"
+    if item_type is float:
+        if _check_float64(item):
+            ret = "float64"
+        else:
+            ret = def_dtype if def_dtype in _FLOAT_DTYPES else "float32"
+        return ivy.as_native_dtype(ret) if as_native else ivy.FloatDtype(ret)
+    if item > 9223372036854775807 and ivy.backend != "torch":
+        ret = "uint64"
+    elif item > 2147483647:
+        ret = "int64"
+    else:
+        ret = def_dtype if def_dtype in _INT_DTYPES else "int32"
+    return ivy.as_native_dtype(ret) if as_native else ivy.IntDtype(ret)
+
+
 # noinspection PyShadowingNames
 def default_dtype(
     dtype: Union[ivy.Dtype, str] = None, item=None, as_native: Optional[bool] = None
@@ -517,10 +683,25 @@ def default_dtype(
         elif as_native is False:
             return ivy.as_ivy_dtype(dtype)
         return dtype
-    as_native = ivy.default(as_native, False)
+    as_native = False if as_native is None else as_native
     if ivy.exists(item):
+        if item.__class__ in (bool, int, float):
+            return _scalar_default_dtype(item, as_native)
         if isinstance(item, (list, tuple, dict)) and len(item) == 0:
             pass
+        elif isinstance(item, (list, tuple, dict)):
+            # the nest is flattened once, and shared with the default dtype functions
+            flat = _flatten_nest(item)
+            if any(isinstance(x, _FLOAT_TYPES) for x in flat):
+                return default_float_dtype(item, as_native=as_native, _flat=flat)
+            elif any(
+                x.__class__ is not bool and isinstance(x, _INT_TYPES) for x in flat
+            ):
+                return default_int_dtype(item, as_native=as_native, _flat=flat)
+            elif as_native:
+                return as_native_dtype("bool")
+            else:
+                return "bool"
         elif ivy.is_float_dtype(item):
             return default_float_dtype(item, as_native=as_native)
         elif ivy.is_int_dtype(item):
@@ -529,9 +710,7 @@ def default_dtype(
             return as_native_dtype("bool")
         else:
             return "bool"
-    global default_dtype_stack
     if not default_dtype_stack:
-        global default_float_dtype_stack
         if default_float_dtype_stack:
             ret = default_float_dtype_stack[-1]
         else:
@@ -560,7 +739,7 @@ def unset_default_dtype():
     """"""
     global default_dtype_stack
     if default_dtype_stack:
-        default_dtype_stack.pop(-1)
+        default_dtype_stack.pop()
 
 
 # noinspection PyShadowingNames
@@ -581,7 +760,7 @@ def unset_default_int_dtype():
     """"""
     global default_int_dtype_stack
     if default_int_dtype_stack:
-        default_int_dtype_stack.pop(-1)
+        default_int_dtype_stack.pop()
 
 
 # noinspection PyShadowingNames
@@ -602,7 +781,7 @@ def unset_default_float_dtype():
     """"""
     global default_float_dtype_stack
     if default_float_dtype_stack:
-        default_float_dtype_stack.pop(-1)
+        default_float_dtype_stack.pop()
 
 
 # noinspection PyShadowingBuiltins
@@ -645,22 +824,13 @@ def is_int_dtype(
     elif isinstance(dtype_in, np.ndarray):
         return "int" in dtype_in.dtype.name
     elif isinstance(dtype_in, Number):
-        return (
-            True
-            if isinstance(dtype_in, (int, np.integer))
-            and not isinstance(dtype_in, bool)
-            else False
-        )
+        return dtype_in.__class__ is not bool and isinstance(dtype_in, _INT_TYPES)
     elif isinstance(dtype_in, (list, tuple, dict)):
-        return (
-            True
-            if ivy.nested_indices_where(
-                dtype_in,
-                lambda x: isinstance(x, (int, np.integer)) and not type(x) == bool,
-            )
-            else False
+        return ivy.nested_any(
+            dtype_in, lambda x: x.__class__ is not bool and isinstance(x, _INT_TYPES)
         )
-    return "int" in as_ivy_dtype(dtype_in)
+    info = _DTYPE_TABLE.get(as_ivy_dtype(dtype_in))
+    return info is not None and info.is_int
 
 
 @inputs_to_native_arrays
@@ -685,16 +855,11 @@ def is_float_dtype(
     elif isinstance(dtype_in, np.ndarray):
         return "float" in dtype_in.dtype.name
     elif isinstance(dtype_in, Number):
-        return True if isinstance(dtype_in, (float, np.floating)) else False
+        return isinstance(dtype_in, _FLOAT_TYPES)
     elif isinstance(dtype_in, (list, tuple, dict)):
-        return (
-            True
-            if ivy.nested_indices_where(
-                dtype_in, lambda x: isinstance(x, (float, np.floating))
-            )
-            else False
-        )
-    return "float" in as_ivy_dtype(dtype_in)
+        return ivy.nested_any(dtype_in, lambda x: isinstance(x, _FLOAT_TYPES))
+    info = _DTYPE_TABLE.get(as_ivy_dtype(dtype_in))
+    return info is not None and info.is_float
 
 
 @inputs_to_native_arrays
@@ -719,7 +884,16 @@ def result_type(
         the dtype resulting from an operation involving the input arrays and dtypes.
 
     """
-    return _cur_backend(arrays_and_dtypes[0]).result_type(arrays_and_dtypes)
+    if len(arrays_and_dtypes) > 1 and all(
+        isinstance(d, str) for d in arrays_and_dtypes
+    ):
+        # dtype strings are promoted pairwise through a per-backend promotion cache
+        version = backend_handler._backend_version
+        ret = functools.reduce(
+            lambda a, b: _promote_types_cached(a, b, version), arrays_and_dtypes
+        )
+        return _cached_backend(version).as_native_dtype(ret)
+    return _cur_backend(arrays_and_dtypes[0]).result_type(*arrays_and_dtypes)
 
 
 def valid_dtype(dtype_in: Union[ivy.Dtype, str, None]) -> bool:
@@ -761,6 +935,11 @@ def invalid_dtype(dtype_in: Union[ivy.Dtype, str, None]) -> bool:
     return ivy.as_ivy_dtype(dtype_in) in ivy.invalid_dtypes
 
 
+@functools.lru_cache(maxsize=8)
+def _import_backend(backend):
+    return importlib.import_module(backend_handler._backend_dict[backend])
+
+
 def convert_dtype(dtype_in: Union[ivy.Dtype, str], backend: str) -> ivy.Dtype:
     """Converts a data type from one backend framework representation to another.
 
@@ -777,12 +956,13 @@ def convert_dtype(dtype_in: Union[ivy.Dtype, str], backend: str) -> ivy.Dtype:
         The data-type in the current ivy backend format
 
     """
-    valid_backends = ["numpy", "jax", "tensorflow", "torch", "mxnet"]
-    if backend not in valid_backends:
+    if backend not in backend_handler._backend_dict:
         raise Exception(
-            "Invalid backend passed, must be one of {}".format(valid_backends)
+            "Invalid backend passed, must be one of {}".format(
+                list(backend_handler._backend_dict)
+            )
         )
-    ivy_backend = importlib.import_module("ivy.functional.backends.{}".format(backend))
+    ivy_backend = _import_backend(backend)
     return ivy.as_native_dtype(ivy_backend.as_ivy_dtype(dtype_in))
 
 
@@ -807,11 +987,24 @@ def function_supported_dtypes(fn: Callable, backend: str) -> ivy.NativeDtype:
     ('int8', 'int16', 'int32', 'int64', 'uint8',\
      'bfloat16', 'float16', 'float32', 'float64', 'bool')
     """
-    valid = list(ivy.valid_dtypes)
-    for d in list(function_unsupported_dtypes(fn, backend)):
-        if d in valid:
-            valid.remove(d)
-    return ivy.as_native_dtype(tuple(valid))
+    valid_dtypes = ivy.valid_dtypes
+    unsupported_dtypes = function_unsupported_dtypes(fn, backend)
+    # cached on fn, and rebuilt whenever the valid or unsupported dtypes change
+    cached = getattr(fn, "_supported_dtypes_cache", None)
+    if (
+        cached is None
+        or cached[0] is not valid_dtypes
+        or cached[1] is not unsupported_dtypes
+    ):
+        unsupported = frozenset(unsupported_dtypes)
+        supported = tuple(d for d in valid_dtypes if d not in unsupported)
+        cached = (valid_dtypes, unsupported_dtypes, ivy.as_native_dtype(supported))
+        try:
+            fn._supported_dtypes_cache = cached
+        except AttributeError:
+            # builtins and bound methods do not support setting attributes
+            pass
+    return cached[2]
 
 
 def function_unsupported_dtypes(fn: Callable, backend: str) -> ivy.NativeDtype:
@@ -834,11 +1027,21 @@ def function_unsupported_dtypes(fn: Callable, backend: str) -> ivy.NativeDtype:
     >>> print(function_unsupported_dtypes(acosh, 'torch'))
     ('float16', 'uint16', 'uint32', 'uint64')
     """
+    invalid_dtypes = ivy.invalid_dtypes
     if hasattr(fn, "unsupported_dtypes"):
-        return fn.unsupported_dtypes + ivy.invalid_dtypes
+        # the merged tuple is cached on fn, and rebuilt whenever the backend's
+        # invalid dtypes change
+        cached = getattr(fn, "_merged_unsupported_dtypes", None)
+        if cached is None or cached[0] is not invalid_dtypes:
+            cached = (invalid_dtypes, fn.unsupported_dtypes + invalid_dtypes)
+            try:
+                fn._merged_unsupported_dtypes = cached
+            except AttributeError:
+                # bound methods do not support setting attributes, so are not cached
+                pass
+        return cached[1]
     else:
-        return ivy.invalid_dtypes
-    return ivy.as_native_dtype(fn.unsupported_dtypes)
+        return invalid_dtypes
 
 
 if __name__ == "__main__":
@@ -297,3 +297,24 @@ def test_zeros_like(
         "zeros_like",
         x=np.asarray(x, dtype=dtype),
     )
+
+
+# zero_allocated()
+@given(
+    shape=st.lists(st.integers(0, 3), min_size=0, max_size=3),
+    dtype=st.sampled_from(ivy_np.valid_numeric_dtypes),
+)
+def test_zero_allocated(shape, dtype, device, call, fw):
+    if fw == "torch" and dtype in ["uint16", "uint32", "uint64"]:
+        return
+    # smoke test
+    ret = ivy.zero_allocated(shape, dtype=dtype, device=device)
+    # type test
+    assert ivy.is_ivy_array(ret)
+    # cardinality test
+    assert ret.shape == tuple(shape)
+    # value test
+    assert np.array_equal(
+        call(ivy.zero_allocated, shape, dtype=dtype, device=device),
+        np.zeros(shape, dtype=dtype),
+    )
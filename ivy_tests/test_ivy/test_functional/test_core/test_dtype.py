@@ -2,6 +2,7 @@
 
 # global
 import numpy as np
+import pytest
 from hypothesis import given, strategies as st
 
 
@@ -68,6 +69,20 @@ def test_astype(
     )
 
 
+# astype
+@pytest.mark.parametrize("dtype", ["int32", "float32"])
+def test_astype_copy(dtype, fw):
+    x = ivy.array([1, 2, 3], dtype=dtype)
+    assert ivy.to_native(ivy.astype(x, x.dtype, copy=False)) is ivy.to_native(x)
+    assert ivy.to_native(ivy.astype(x, x.dtype, copy=True)) is not ivy.to_native(x)
+    # the ivy-level function is used when no backend is set
+    ivy.unset_backend()
+    x = ivy.array([1, 2, 3], dtype=dtype)
+    assert ivy.to_native(ivy.astype(x, x.dtype, copy=False)) is ivy.to_native(x)
+    assert ivy.to_native(ivy.astype(x, x.dtype, copy=True)) is not ivy.to_native(x)
+    ivy.set_backend(fw)
+
+
 # broadcast_to
 @given(
     array_shape=helpers.lists(
@@ -335,8 +350,98 @@ def test_is_int_dtype(
     )
 
 
+# default_float_dtype
+@pytest.mark.parametrize(
+    "x_n_dtype",
+    [
+        [0.1, "float32"],
+        [1e-05, "float32"],
+        [2.0**-126, "float32"],
+        [16777217.0, "float64"],
+        [1e16, "float64"],
+        [1e20, "float64"],
+        [3.5e38, "float64"],
+        [2.0**-127, "float64"],
+        [1e-39, "float64"],
+        [5e-324, "float64"],
+    ],
+)
+def test_default_float_dtype_from_input(x_n_dtype):
+    x, dtype = x_n_dtype
+    assert ivy.default_float_dtype(input=x) == dtype
+    assert ivy.default_float_dtype(input=[x]) == dtype
+
+
+# default_int_dtype
+@pytest.mark.parametrize(
+    "x_n_dtype",
+    [
+        [[1, 2, 3], "int32"],
+        [[2147483648], "int64"],
+        [[2147483648, 0.5], "int64"],
+        [[9223372036854775807], "int64"],
+        [[9223372036854775807, 0.5], "int64"],
+    ],
+)
+def test_default_int_dtype_from_input(x_n_dtype):
+    x, dtype = x_n_dtype
+    assert ivy.default_int_dtype(input=x) == dtype
+
+
+# result_type
+@pytest.mark.parametrize(
+    "dtypes",
+    [
+        ["float32", "float64"],
+        ["int8", "int32"],
+        ["uint8", "int16"],
+        ["int8", "int16", "int64"],
+        ["float16", "float32", "float64"],
+    ],
+)
+def test_result_type(dtypes, fw):
+    expected = np.result_type(*dtypes).name
+    # the ivy-level function is used when no backend is set
+    ivy.unset_backend()
+    assert ivy.as_ivy_dtype(ivy.result_type(*dtypes)) == expected
+    x = ivy.array([1, 2], dtype=dtypes[0])
+    assert ivy.as_ivy_dtype(ivy.result_type(x, *dtypes[1:])) == expected
+    ivy.set_backend(fw)
+
+
+# function_supported_dtypes
+def test_function_supported_dtypes_uncacheable_fn():
+    backend = ivy.current_backend_str()
+    expected = ivy.function_supported_dtypes(lambda x: x, backend)
+    assert ivy.function_supported_dtypes(len, backend) == expected
+    assert ivy.function_supported_dtypes(ivy.array([1]).__add__, backend) == expected
+
+
+# function_unsupported_dtypes
+def test_function_unsupported_dtypes_bound_method():
+    class _Fn:
+        def method(self):
+            pass
+
+    _Fn.method.unsupported_dtypes = ("float16",)
+    fn = _Fn().method
+    expected = ("float16",) + ivy.invalid_dtypes
+    assert ivy.function_unsupported_dtypes(fn, ivy.current_backend_str()) == expected
+    assert ivy.function_unsupported_dtypes(fn, ivy.current_backend_str()) == expected
+
+
+# DefaultIntDtype
+def test_default_int_dtype_context():
+    orig = ivy.default_int_dtype()
+    with ivy.DefaultIntDtype(int_dtype="int8"):
+        assert ivy.default_int_dtype() == "int8"
+        with ivy.DefaultIntDtype(ivy.int16):
+            assert ivy.default_int_dtype() == "int16"
+        assert ivy.default_int_dtype() == "int8"
+    assert ivy.default_int_dtype() == orig
+
+
 # Still to Add #
 # ---------------#
 
 # broadcast_arrays
-# result_type